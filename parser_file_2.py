@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from utils import merge_and_save_data
 
@@ -47,50 +48,80 @@ def parse_proposals_with_slicing(proposal_table_text, company_id):
     # Return the final list of parsed proposal data for this company.
     return proposals_data
 
-def process_and_parse_report(raw_file_content): #It cleans the raw text, then parses out the header and proposal data into two separate DataFrames.I
-
-    header_pattern = r'^.*?(?=____________________________________________________________________)'
-    content_no_header = re.sub(header_pattern, '', raw_file_content, count=1, flags=re.DOTALL)
-    # Remove the file footer (everything from the SIGNATURES section to the end).
-    footer_pattern = r'<PAGE>\s+SIGNATURES.*'
-    cleaned_content = re.sub(footer_pattern, '', content_no_header, flags=re.DOTALL).strip()
-
-    
-    # capture all the fields from the multi-line header block.
-    header_pattern_re = re.compile(
-        r"^(?P<CompanyName>.*?)\n"
-        r"Ticker\s+Security ID:\s+Meeting Date\s+Meeting Status\n"
-        r"(?P<Ticker>\S*)\s+CUSIP\s+(?P<SecurityID>\S*)\s+(?P<MeetingDate>\S*)\s+(?P<MeetingStatus>\S*)\n"
-        r"Meeting Type\s+Country of Trade\n"
-        r"(?P<MeetingType>\S*)\s+(?P<CountryOfTrade>.*?)\s*$", re.MULTILINE
-    )
-    # Split the cleaned text into a list of "blocks", one for each company.
-    company_blocks = cleaned_content.split('____________________________________________________________________')
-    all_headers_data, all_proposals_data = [], []
-    company_id_counter = 0 # Initialize a counter for unique company IDs.
-
-    # Loop through each company block to extract its data.
-    for block in company_blocks:
-        block = block.strip()
-        if not block: continue # Skip any empty blocks.
-
-        company_id_counter += 1 # Increment the ID for the new company.
-
+# The separator line that sits between company blocks in the report.
+BLOCK_SEPARATOR = '____________________________________________________________________'
+FOOTER_RE = re.compile(r'<PAGE>\s+SIGNATURES')
+
+# capture all the fields from the multi-line header block.
+HEADER_PATTERN_RE = re.compile(
+    r"^(?P<CompanyName>.*?)\n"
+    r"Ticker\s+Security ID:\s+Meeting Date\s+Meeting Status\n"
+    r"(?P<Ticker>\S*)\s+CUSIP\s+(?P<SecurityID>\S*)\s+(?P<MeetingDate>\S*)\s+(?P<MeetingStatus>\S*)\n"
+    r"Meeting Type\s+Country of Trade\n"
+    r"(?P<MeetingType>\S*)\s+(?P<CountryOfTrade>.*?)\s*$", re.MULTILINE
+)
+PROPOSAL_TABLE_RE = re.compile(r'For/Against\s+Mgmt\n(.*?)$', re.DOTALL)
+
+def find_company_blocks(raw_file_content): # Yields (start, end) offsets of each company block without copying the text.
+    text = raw_file_content
+    # Everything before the first separator is the file header.
+    body_start = text.find(BLOCK_SEPARATOR)
+    if body_start == -1:
+        body_start = 0
+    # Everything from the SIGNATURES section to the end is the file footer.
+    footer_match = FOOTER_RE.search(text, body_start)
+    body_end = footer_match.start() if footer_match else len(text)
+
+    block_start = body_start
+    while block_start <= body_end:
+        sep_pos = text.find(BLOCK_SEPARATOR, block_start, body_end)
+        block_end = sep_pos if sep_pos != -1 else body_end
+        yield block_start, block_end
+        if sep_pos == -1:
+            break
+        block_start = sep_pos + len(BLOCK_SEPARATOR)
+
+def parse_company_block_chunk(chunk): # Parses a list of (company_id, block_text) pairs; runs inside a worker process.
+    headers_data, proposals_data = [], []
+    for company_id, block in chunk:
         # Use the regex to find and extract the header data for this block.
-        header_match = header_pattern_re.search(block)
+        header_match = HEADER_PATTERN_RE.search(block)
         if header_match:
             # .groupdict() returns a clean dictionary of the captured data.
             header_data = header_match.groupdict()
-            header_data['ID'] = company_id_counter # Add the unique ID.
-            all_headers_data.append(header_data)
+            header_data['ID'] = company_id # Add the unique ID.
+            headers_data.append(header_data)
 
         # Isolate the proposal table text from the bottom of the block.
-        proposal_table_text = re.search(r'For/Against\s+Mgmt\n(.*?)$', block, re.DOTALL)
+        proposal_table_text = PROPOSAL_TABLE_RE.search(block)
         if proposal_table_text:
             # Call our specialized slicing function to parse the table.
-            proposals = parse_proposals_with_slicing(proposal_table_text.group(1), company_id_counter)
-            # Add the returned list of proposals to our master list.
-            all_proposals_data.extend(proposals)
+            proposals_data.extend(parse_proposals_with_slicing(proposal_table_text.group(1), company_id))
+    return headers_data, proposals_data
+
+def process_and_parse_report(raw_file_content, max_workers=None, chunk_size=250): #It cleans the raw text, then parses out the header and proposal data into two separate DataFrames.
+    # Cut the text into company blocks by offset and give each non-empty block a stable ID in file order.
+    numbered_blocks = []
+    for start, end in find_company_blocks(raw_file_content):
+        block = raw_file_content[start:end].strip()
+        if not block: continue # Skip any empty blocks.
+        numbered_blocks.append((len(numbered_blocks) + 1, block))
+
+    # Group the blocks into chunks so each worker gets a decent amount of work per task.
+    chunks = [numbered_blocks[i:i + chunk_size] for i in range(0, len(numbered_blocks), chunk_size)]
+
+    if len(chunks) > 1 and max_workers != 1:
+        # Parse the chunks on a process pool; map() returns results in the original order.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(parse_company_block_chunk, chunks))
+    else:
+        # Small files aren't worth the cost of starting worker processes.
+        results = [parse_company_block_chunk(chunk) for chunk in chunks]
+
+    all_headers_data, all_proposals_data = [], []
+    for headers_data, proposals_data in results:
+        all_headers_data.extend(headers_data)
+        all_proposals_data.extend(proposals_data)
 
     # Convert the lists of dictionaries into pandas DataFrames.
     df_headers = pd.DataFrame(all_headers_data)